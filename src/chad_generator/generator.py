@@ -1,143 +1,435 @@
+"""Virgin vs Chad meme generator.
+
+Template resizing and compositing are the pixel-bound steps here. For a
+faster build, Pillow-SIMD can be installed as a drop-in replacement:
+
+    pip uninstall pillow && CC="cc -mavx2" pip install -U --force-reinstall pillow-simd
+
+Templates are resized with BICUBIC by default, which Pillow-SIMD vectorizes
+well; PILLOW_SIMD tells whether such a build is in use.
+"""
+
 from PIL import Image, ImageDraw, ImageFont
 from typing import Dict, Tuple, List, Optional
 import os
 import json
+import hashlib
+import functools
+import collections
+import concurrent.futures
+import threading
+import time
 import random
 import textwrap
 import anthropic
+import numpy as np
+
+# Pillow-SIMD releases carry a ".postN" suffix on the Pillow version
+PILLOW_SIMD = ".post" in Image.__version__
+
+MODEL = "claude-3-5-haiku-latest"
+
+# Static instructions sent as the system prompt; only the variables go in the
+# user message. At this size the prompt is below the model's minimum cacheable
+# length, so it is not marked for prompt caching.
+STATIC_PROMPT = """Generate contrasting points for a Virgin vs Chad meme comparing the given topic. It should focus on the virgin being the given virgin side.
+
+The user message provides the variables:
+- topic: the "X vs Y" comparison
+- virgin: the side that plays the virgin
+- num_points: how many points to generate per side
+
+Requirements:
+- Generate exactly num_points points per side
+- Each point must be under 40 characters
+- Embrace absurd, hyperbolic comparisons
+- Mix physical and behavioral traits
+- Include both serious and ridiculous elements
+- Focus on stereotypical extremes
+
+Return the response in the following JSON format:
+{
+    "virgin_points": ["point1", "point2", ...],
+    "chad_points": ["point1", "point2", ...]
+}
+
+Example output format:
+{
+    "virgin_points": [
+        "Bags under eyes from overtime",
+        "Dead inside from meetings",
+        "Lives for weekend coffee breaks",
+        "No time for dating or hobbies",
+        "Corporate slave mentality"
+    ],
+    "chad_points": [
+        "Perfect skin from zero stress",
+        "Sleeps 12 hours like a king",
+        "Has time to master 5 hobbies",
+        "Government pays him to exist",
+        "Never touched a spreadsheet"
+    ]
+}
+
+Ensure exactly num_points points per side and maintain thematic connections between opposing traits.
+Return only the JSON, no additional text or explanations.
+"""
+
+
+# Attempts at generating points before falling back to the built-in templates
+MAX_ATTEMPTS = 3
+
+
+class PointGenerationError(Exception):
+    """Raised when points could not be generated through the API"""
+
+
+# Generated points are stored here so repeated topics skip the API round-trip
+CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "chad-generator", "points.json"
+)
+
+# Cached points older than this (in seconds) are regenerated
+CACHE_TTL = 30 * 24 * 60 * 60
+
+# Serializes points cache updates between threads
+_CACHE_LOCK = threading.Lock()
+
+# Most seeded memes kept in memory per generator. Each entry is a full
+# 1600x1000 RGB canvas of about 4.8 MB, so the cache holds up to about 77 MB.
+MEME_CACHE_SIZE = 16
 
 
 class ArgumentGenerator:
-    def __init__(self, api_key: Optional[str] = None):
+    # Shared wrapper so its regexes aren't rebuilt for every point
+    _WRAPPER = textwrap.TextWrapper(width=25, break_long_words=False)
+    # Bullet characters the model may prefix points with
+    _BULLET_CHARS = "- *•"
+
+    # Fallback points used when the API is unavailable
+    _CHAD_TEMPLATES = (
+        "{topic} feared by gods",
+        "Makes chads stronger",
+        "{topic} energy radiates",
+        "Never needs practice",
+        "Crushes competition",
+        "Has 300 IQ moves",
+        "Gigachad approves",
+        "Sigma {topic} grindset",
+    )
+    _VIRGIN_TEMPLATES = (
+        "Mom still buys {topic}",
+        "Scared of {topic} power",
+        "Needs {topic} manual",
+        "Everyone mocks him",
+        "Can't handle basics",
+        "Cries at {topic}",
+        "Zero skill level",
+        "Still uses training mode",
+    )
+
+    def __init__(
+        self, api_key: Optional[str] = None, cache_path: Optional[str] = CACHE_PATH
+    ):
         self.use_api = bool(api_key)
         if self.use_api:
             self.client = anthropic.Anthropic(api_key=api_key)
+        self.cache_path = cache_path
+        self._cache = self._load_cache()
 
-    def _wrap_text(self, text: str, max_chars: int = 25) -> str:
+    def _load_cache(self) -> Dict[str, Dict[str, List[str]]]:
+        """Load previously generated points from disk"""
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        # The file may be hand-edited or corrupt; malformed entries are misses
+        if not isinstance(data, dict):
+            return {}
+        return {k: v for k, v in data.items() if self._is_valid_entry(v)}
+
+    def _store_points(self, key: str, entry: Dict) -> None:
+        """Add an entry to the points cache and write it back to disk"""
+        # Insert under the lock too, so a concurrent save can't drop the entry
+        with _CACHE_LOCK:
+            self._cache[key] = entry
+            if not self.cache_path:
+                return
+            # Merge with entries other generators wrote since this one loaded,
+            # then swap the file in atomically so readers never see it half-written
+            merged = {**self._load_cache(), **self._cache}
+            self._cache = {k: v for k, v in merged.items() if self._is_fresh(v)}
+            tmp_path = f"{self.cache_path}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                with open(tmp_path, "w") as f:
+                    json.dump(self._cache, f, indent=2)
+                os.replace(tmp_path, self.cache_path)
+            except OSError as e:
+                print(f"Failed to write points cache: {e}")
+
+    @staticmethod
+    def _cache_key(topic: str, virgin: str, num_points: int) -> str:
+        """Build the exact-match cache key for a generation request
+
+        Topics are case- and whitespace-normalized so "Cats vs Dogs" and
+        "cats vs dogs " share an entry.
+        """
+        topic = " ".join(topic.lower().split())
+        virgin = " ".join(virgin.lower().split())
+        return hashlib.blake2b(f"{topic}|{virgin}|{num_points}".encode()).hexdigest()
+
+    @staticmethod
+    def _is_point_list(points) -> bool:
+        """Whether points is a list of strings"""
+        return isinstance(points, list) and all(isinstance(p, str) for p in points)
+
+    @staticmethod
+    def _is_valid_entry(entry) -> bool:
+        """Whether a cache entry has the shape _store_points writes"""
+        return (
+            isinstance(entry, dict)
+            and ArgumentGenerator._is_point_list(entry.get("chad_points"))
+            and ArgumentGenerator._is_point_list(entry.get("virgin_points"))
+            and isinstance(entry.get("created", 0), (int, float))
+        )
+
+    @staticmethod
+    def _is_fresh(entry: Dict) -> bool:
+        """Whether a cache entry is younger than CACHE_TTL"""
+        return time.time() - entry.get("created", 0) < CACHE_TTL
+
+    @staticmethod
+    def _wrap_text(text: str) -> str:
         """Wrap text to multiple lines if too long"""
-        lines = textwrap.wrap(text, width=max_chars, break_long_words=False)
-        return "\n".join(lines)
+        return "\n".join(ArgumentGenerator._WRAPPER.wrap(text))
 
-    def _format_point(self, point: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _format_point(point: str) -> str:
         """Format and wrap a point to fit the meme style"""
-        point = point.lstrip("- *•").strip()
-        wrapped = self._wrap_text(point)
+        # Cached because the themed fallback points recur across memes
+        point = point.lstrip(ArgumentGenerator._BULLET_CHARS).strip()
+        wrapped = ArgumentGenerator._wrap_text(point)
         lines = wrapped.split("\n")
         lines[0] = f"• {lines[0]}"
         if len(lines) > 1:
             lines[1:] = [f"  {line}" for line in lines[1:]]
         return "\n".join(lines)
 
-    def generate_points(
-        self, topic: str, virgin, num_points: int = 5
+    def _request_points(
+        self, topic: str, virgin, num_points: int
     ) -> Tuple[List[str], List[str]]:
-        """Generate exactly num_points points with consistent theming for both sides"""
+        """Ask Claude for one set of raw (chad, virgin) points"""
+        response = self.client.messages.create(
+            model=MODEL,
+            # About 20 tokens per point on each side plus the JSON scaffolding
+            max_tokens=40 + 20 * 2 * num_points,
+            # The JSON object ends at its only closing brace, so stop there
+            stop_sequences=["}"],
+            system=STATIC_PROMPT,
+            messages=[
+                {
+                    "role": "user",
+                    "content": f"topic={topic}\nvirgin={virgin}\nnum_points={num_points}\nReturn JSON only.",
+                },
+                {
+                    "role": "assistant",
+                    "content": "I will respond with only valid JSON.",
+                },
+            ],
+        )
 
-        try:
-            prompt = f"""Generate contrasting points for a Virgin vs Chad meme comparing {topic}. It should focus on the virgin being {virgin}
-
-            Requirements:
-            - Generate exactly {num_points} points per side
-            - Each point must be under 40 characters
-            - Embrace absurd, hyperbolic comparisons
-            - Mix physical and behavioral traits
-            - Include both serious and ridiculous elements
-            - Focus on stereotypical extremes
-
-            Return the response in the following JSON format:
-            {{
-                "virgin_points": ["point1", "point2", ...],
-                "chad_points": ["point1", "point2", ...]
-            }}
-
-            Example output format:
-            {{
-                "virgin_points": [
-                    "Bags under eyes from overtime",
-                    "Dead inside from meetings",
-                    "Lives for weekend coffee breaks",
-                    "No time for dating or hobbies",
-                    "Corporate slave mentality"
-                ],
-                "chad_points": [
-                    "Perfect skin from zero stress",
-                    "Sleeps 12 hours like a king",
-                    "Has time to master 5 hobbies",
-                    "Government pays him to exist",
-                    "Never touched a spreadsheet"
-                ]
-            }}
-
-            Ensure exactly {num_points} points per side and maintain thematic connections between opposing traits.
-            Return only the JSON, no additional text or explanations.
-            """
-
-            response = self.client.messages.create(
-                model="claude-3-5-haiku-latest",
-                max_tokens=300,
-                messages=[
-                    {"role": "user", "content": prompt},
-                    {
-                        "role": "assistant",
-                        "content": "I will respond with only valid JSON.",
-                    },
-                ],
+        if response.stop_reason == "max_tokens":
+            raise ValueError("Response was truncated at max_tokens")
+
+        text = response.content[0].text.strip()
+        if response.stop_reason == "stop_sequence":
+            text += response.stop_sequence
+        points_data = json.loads(text)
+        if not isinstance(points_data, dict):
+            raise ValueError("Response is not a JSON object")
+        virgin_points = points_data["virgin_points"]
+        chad_points = points_data["chad_points"]
+
+        # Validate point types before they reach the cached formatting
+        if not (
+            self._is_point_list(virgin_points) and self._is_point_list(chad_points)
+        ):
+            raise ValueError("Points must be lists of strings")
+
+        # Validate point counts
+        if len(virgin_points) != num_points or len(chad_points) != num_points:
+            raise ValueError(
+                f"Expected {num_points} points per side, got {len(virgin_points)} virgin and {len(chad_points)} chad points"
             )
 
-            try:
-                points_data = json.loads(response.content[0].text.strip())
-                virgin_points = points_data["virgin_points"]
-                chad_points = points_data["chad_points"]
-
-                # Validate point counts
-                if len(virgin_points) != num_points or len(chad_points) != num_points:
-                    raise ValueError(
-                        f"Expected {num_points} points per side, got {len(virgin_points)} virgin and {len(chad_points)} chad points"
-                    )
+        return chad_points, virgin_points
 
-                # Format the points
-                return (
-                    [self._format_point(p) for p in chad_points],
-                    [self._format_point(p) for p in virgin_points],
-                )
+    def generate_points(
+        self, topic: str, virgin, num_points: int = 5
+    ) -> Tuple[List[str], List[str]]:
+        """Generate exactly num_points points with consistent theming for both sides
+
+        Raises:
+            PointGenerationError: If no API key is set or every attempt failed
+        """
 
-            except json.JSONDecodeError:
-                print(f"Failed to parse JSON response: {response.content[0].text}")
-                exit(2)
+        key = self._cache_key(topic, virgin, num_points)
+        cached = self._cache.get(key)
+        if cached is not None and self._is_fresh(cached):
+            return cached["chad_points"], cached["virgin_points"]
 
-        except Exception as e:
-            print(f"API generation failed: {e}")
-            exit(1)
+        if not self.use_api:
+            raise PointGenerationError("No Anthropic API key configured")
+
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                chad_points, virgin_points = self._request_points(
+                    topic, virgin, num_points
+                )
+                break
+            except (
+                anthropic.APIError,
+                json.JSONDecodeError,
+                KeyError,
+                ValueError,
+                TypeError,
+                IndexError,
+            ) as e:
+                print(f"API generation attempt {attempt + 1} failed: {e}")
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise PointGenerationError(
+                        f"API generation failed after {MAX_ATTEMPTS} attempts"
+                    ) from e
+                time.sleep(2**attempt)
+
+        # Format the points
+        chad_points = [self._format_point(p) for p in chad_points]
+        virgin_points = [self._format_point(p) for p in virgin_points]
+
+        self._store_points(
+            key,
+            {
+                "chad_points": chad_points,
+                "virgin_points": virgin_points,
+                "created": time.time(),
+            },
+        )
+        return chad_points, virgin_points
 
     def _generate_themed_points(
-        self, topic: str, is_chad: bool, num_points: int
+        self, topic: str, is_chad: bool, num_points: int, rng=random
     ) -> List[str]:
         """Generate exactly num_points thematically consistent points"""
-        chad_templates = [
-            f"{topic} feared by gods",
-            f"Makes chads stronger",
-            f"{topic} energy radiates",
-            f"Never needs practice",
-            f"Crushes competition",
-            f"Has 300 IQ moves",
-            f"Gigachad approves",
-            f"Sigma {topic} grindset",
-        ]
+        templates = self._formatted_templates(topic, is_chad)
+        # Repeat shuffled rounds when more points are needed than templates exist
+        points = []
+        while len(points) < num_points:
+            points.extend(
+                rng.sample(templates, min(len(templates), num_points - len(points)))
+            )
+        return points
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _formatted_templates(topic: str, is_chad: bool) -> Tuple[str, ...]:
+        """Fallback points for a topic, filled in and formatted once per topic"""
+        templates = (
+            ArgumentGenerator._CHAD_TEMPLATES
+            if is_chad
+            else ArgumentGenerator._VIRGIN_TEMPLATES
+        )
+        return tuple(
+            ArgumentGenerator._format_point(t.format(topic=topic)) for t in templates
+        )
 
-        virgin_templates = [
-            f"Mom still buys {topic}",
-            f"Scared of {topic} power",
-            f"Needs {topic} manual",
-            f"Everyone mocks him",
-            f"Can't handle basics",
-            f"Cries at {topic}",
-            f"Zero skill level",
-            f"Still uses training mode",
-        ]
 
-        templates = chad_templates if is_chad else virgin_templates
-        selected = random.sample(templates, num_points)
-        return [self._format_point(p) for p in selected]
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+
+@functools.lru_cache(maxsize=16)
+def _get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a font once per (path, size), falling back to Pillow's default"""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default(size)
+
+
+def _get_line_height(font: ImageFont.FreeTypeFont) -> int:
+    """Line height used when stacking wrapped text lines"""
+    bbox = font.getbbox("A")
+    return bbox[3] - bbox[1] + 5
+
+
+@functools.lru_cache(maxsize=128)
+def _get_text_width(text: str, font: ImageFont.FreeTypeFont) -> int:
+    """Advance width of a single line of text"""
+    # getlength only sums advances, skipping the ink box getbbox computes
+    return int(font.getlength(text))
+
+
+@functools.lru_cache(maxsize=512)
+def _render_text(
+    text: str, font: ImageFont.FreeTypeFont, line_height: int
+) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Render outlined text onto a transparent tile sized to its bounding box
+
+    Returns the tile and the offset of its top-left corner from the text
+    origin. Tiles are shared between calls and must not be modified.
+    """
+    outline_color = (255, 255, 255)
+    text_color = (0, 0, 0)
+    outline_width = 3
+
+    lines = text.split("\n")
+
+    # Union of the stroked line boxes, relative to the text origin
+    boxes = [font.getbbox(line, stroke_width=outline_width) for line in lines]
+    left = min(box[0] for box in boxes)
+    top = min(box[1] + i * line_height for i, box in enumerate(boxes))
+    right = max(box[2] for box in boxes)
+    bottom = max(box[3] + i * line_height for i, box in enumerate(boxes))
+
+    tile = Image.new("RGBA", (right - left, bottom - top), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(tile)
+    for i, line in enumerate(lines):
+        # Draw text and outline in a single stroked pass
+        draw.text(
+            (-left, i * line_height - top),
+            line,
+            font=font,
+            fill=text_color,
+            stroke_width=outline_width,
+            stroke_fill=outline_color,
+        )
+
+    return tile, (left, top)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_template(
+    path: str, height: int, resample: Image.Resampling = Image.Resampling.BICUBIC
+) -> Image.Image:
+    """Decode a template and resize it to height while maintaining aspect ratio
+
+    The returned image is shared between calls and must not be modified.
+    """
+    img = Image.open(path)
+    aspect_ratio = img.width / img.height
+    new_width = int(height * aspect_ratio)
+
+    # Let the decoder downscale much larger sources (JPEG) before resampling
+    if img.height > 2 * height:
+        img.draft("RGB", (new_width * 2, height * 2))
+
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    return img.resize((new_width, height), resample)
 
 
 class TextLayoutManager:
@@ -145,6 +437,7 @@ class TextLayoutManager:
         self.width = canvas_width
         self.height = canvas_height
         self.num_points = num_points
+        self.rng = np.random.default_rng()
 
         # Centers for the figures
         self.centers = {
@@ -158,33 +451,34 @@ class TextLayoutManager:
             "chad": (self.width * 0.7, self.width * 0.95),  # Right side spread
         }
 
-    def get_positions(self, is_chad: bool) -> List[Tuple[int, int]]:
-        """Get text positions spread out horizontally from the figure"""
-        positions = []
-        center = self.centers["chad" if is_chad else "virgin"]
-        spread_range = self.spreads["chad" if is_chad else "virgin"]
-
-        # Calculate vertical spacing
-        total_height = 400  # Height range for text
-        vertical_step = (
-            total_height / (self.num_points - 1) if self.num_points > 1 else 0
+        # Vertical spacing is the same for both sides
+        self.total_height = 400  # Height range for text
+        self.vertical_step = (
+            self.total_height / (self.num_points - 1) if self.num_points > 1 else 0
         )
-        base_y = center[1] - total_height / 2  # Start from above the center
+        # Start from above the figure center
+        self.base_y = self.height * 0.5 - self.total_height / 2
 
-        for i in range(self.num_points):
-            # Alternate between left and right of the spread range
-            x_offset = random.uniform(-30, 30)  # Small random horizontal variation
-            if is_chad:
-                x = spread_range[0] + x_offset
-            else:
-                x = spread_range[1] + x_offset
+    def get_positions(
+        self, is_chad: bool, rng: Optional[np.random.Generator] = None
+    ) -> List[Tuple[int, int]]:
+        """Get text positions spread out horizontally from the figure"""
+        if rng is None:
+            rng = self.rng
+        spread_range = self.spreads["chad" if is_chad else "virgin"]
 
-            # Add some random vertical variation
-            y = base_y + (i * vertical_step) + random.uniform(-20, 20)
+        # Start at the spread edge nearest the figure, with a small random
+        # horizontal variation
+        xs = spread_range[0 if is_chad else 1] + rng.uniform(-30, 30, self.num_points)
 
-            positions.append((int(x), int(y)))
+        # Evenly spaced rows with some random vertical variation
+        ys = (
+            self.base_y
+            + np.arange(self.num_points) * self.vertical_step
+            + rng.uniform(-20, 20, self.num_points)
+        )
 
-        return positions
+        return list(zip(xs.astype(int).tolist(), ys.astype(int).tolist()))
 
     def calculate_text_bounds(
         self, text: str, position: Tuple[int, int], font
@@ -198,83 +492,144 @@ class TextLayoutManager:
 
 
 class WojakMemeGenerator:
+    # Template pairs per template directory, shared by all generators
+    _pair_cache: Dict[str, List[Tuple[str, str]]] = {}
+
     def __init__(
         self,
         template_dir: str = "templates",
         api_key: Optional[str] = None,
         num_points: int = 5,
+        resample: Image.Resampling = Image.Resampling.BICUBIC,
+        cache_path: Optional[str] = CACHE_PATH,
     ):
+        # A falsy cache_path keeps generated points in memory only
+        self.argument_generator = ArgumentGenerator(api_key, cache_path)
         self.template_dir = template_dir
         self.template_pairs = self._map_template_pairs()
         self.target_dimensions = (400, 500)
+        # Filter used when resizing templates to target_dimensions
+        self.resample = resample
+        # Decode and resize every template once
+        self._resized_pairs = [
+            (self._load_and_resize(virgin), self._load_and_resize(chad))
+            for virgin, chad in self.template_pairs
+        ]
         self.canvas_size = (1600, 1000)
-        self.argument_generator = ArgumentGenerator(api_key)
+        # Backgrounds with each template pair pasted in, so no template
+        # compositing happens while generating a meme
+        self._base_canvases = [
+            self._build_base_canvas(virgin_img, chad_img)
+            for virgin_img, chad_img in self._resized_pairs
+        ]
         self.layout_manager = TextLayoutManager(*self.canvas_size, num_points)
 
+        # Fonts and line heights are fixed, so resolve them once up front
+        self._body_font = _get_font(FONT_PATH, 24)
+        self._title_font = _get_font(FONT_PATH, 40)
+        self._body_line_height = _get_line_height(self._body_font)
+        self._title_line_height = _get_line_height(self._title_font)
+
+        # Finished seeded memes, least recently used first
+        self._meme_cache: "collections.OrderedDict[tuple, Image.Image]" = (
+            collections.OrderedDict()
+        )
+        self._meme_cache_lock = threading.Lock()
+
     def _map_template_pairs(self) -> List[Tuple[str, str]]:
         """Map virgin and chad templates that should go together"""
-        virgin_templates = sorted(
-            [f for f in os.listdir(self.template_dir) if f.startswith("virgin")]
+        cache_key = os.path.abspath(self.template_dir)
+        if cache_key in self._pair_cache:
+            return list(self._pair_cache[cache_key])
+
+        virgin_templates, chad_templates = [], []
+        with os.scandir(self.template_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("virgin"):
+                    virgin_templates.append(entry.name)
+                elif entry.name.startswith("chad"):
+                    chad_templates.append(entry.name)
+        virgin_templates.sort()
+        chad_templates.sort()
+        self._pair_cache[cache_key] = list(zip(virgin_templates, chad_templates))
+        return list(self._pair_cache[cache_key])
+
+    def _load_and_resize(self, filename: str) -> Image.Image:
+        """Load a template resized to target dimensions, reusing earlier loads"""
+        return _load_template(
+            os.path.join(self.template_dir, filename),
+            self.target_dimensions[1],
+            self.resample,
         )
-        chad_templates = sorted(
-            [f for f in os.listdir(self.template_dir) if f.startswith("chad")]
-        )
-        return list(zip(virgin_templates, chad_templates))
 
-    def _resize_template(self, img: Image.Image) -> Image.Image:
-        """Resize image to target dimensions while maintaining aspect ratio"""
-        aspect_ratio = img.width / img.height
-        new_height = self.target_dimensions[1]
-        new_width = int(new_height * aspect_ratio)
-        return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    def _build_base_canvas(
+        self, virgin_img: Image.Image, chad_img: Image.Image
+    ) -> Tuple[Image.Image, int, int]:
+        """Build the background for a template pair and its title anchor x positions
+
+        The background is shared between memes and must be copied before
+        drawing on it.
+        """
+        # The output is fully opaque, so skip the alpha plane entirely
+        canvas = Image.new("RGB", self.canvas_size, (255, 255, 255))
 
-    def _add_text_with_outline(
+        # Position images
+        virgin_x = int(self.canvas_size[0] * 0.35 - virgin_img.width / 2)
+        chad_x = int(self.canvas_size[0] * 0.65 - chad_img.width / 2)
+
+        canvas.paste(virgin_img, (virgin_x, 250), virgin_img)
+        canvas.paste(chad_img, (chad_x, 250), chad_img)
+
+        # Titles are centered on these x positions
+        return (
+            canvas,
+            virgin_x + virgin_img.width // 4,
+            chad_x + chad_img.width // 4,
+        )
+
+    def _render_text_tile(
         self,
-        draw: ImageDraw,
         text: str,
         position: Tuple[int, int],
-        font: ImageFont.FreeTypeFont,
         is_title: bool = False,
-    ) -> None:
-        """Add text with outline for better readability"""
-        x, y = position
-        outline_color = (255, 255, 255)
-        text_color = (0, 0, 0)
-        outline_width = 3
+    ) -> Tuple[Image.Image, Tuple[int, int]]:
+        """Get the outlined text tile for text placed at position
 
+        Returns the tile and the canvas position of its top-left corner.
+        """
+        x, y = position
         if is_title:
-            font = font.font_variant(size=40)
-
-        lines = text.split("\n")
-        bbox = font.getbbox("A")
-        line_height = bbox[3] - bbox[1] + 5
-
-        for i, line in enumerate(lines):
-            line_y = y + (i * line_height)
+            font, line_height = self._title_font, self._title_line_height
+        else:
+            font, line_height = self._body_font, self._body_line_height
 
-            # Draw outline
-            for dx in range(-outline_width, outline_width + 1):
-                for dy in range(-outline_width, outline_width + 1):
-                    draw.text(
-                        (x + dx, line_y + dy), line, font=font, fill=outline_color
-                    )
+        tile, (left, top) = _render_text(text, font, line_height)
+        return tile, (x + left, y + top)
 
-            # Draw main text
-            draw.text((x, line_y), line, font=font, fill=text_color)
+    def _composite_tiles(
+        self,
+        canvas: Image.Image,
+        tiles: List[Tuple[Image.Image, Tuple[int, int]]],
+    ) -> None:
+        """Blend text tiles onto the canvas using their alpha, top to bottom"""
+        for tile, position in sorted(tiles, key=lambda t: t[1][1]):
+            canvas.paste(tile, position, tile)
 
-    def generate_meme(self, topic: str, virgin_side: str = "left") -> Image.Image:
+    def generate_meme(
+        self, topic: str, virgin_side: str = "left", seed: Optional[int] = None
+    ) -> Image.Image:
         """Generate the complete Virgin vs Chad meme
 
         Args:
             topic (str): Input in format "X vs Y"
             virgin_side (str): Which side the virgin should be on ("left" or "right")
                             Default is "left"
+            seed (Optional[int]): Seeds the template and layout choices; seeded
+                            memes are cached and repeat calls return a copy
 
         Returns:
             Image.Image: Generated meme image
         """
-        canvas = Image.new("RGBA", self.canvas_size, (255, 255, 255, 255))
-
         # Split the topic into two parts
         topic_parts = topic.split(" vs ")
         if len(topic_parts) != 2:
@@ -289,71 +644,98 @@ class WojakMemeGenerator:
             virgin = topic_parts[1]
             chad = topic_parts[0]
 
-        # Get templates
-        virgin_template, chad_template = random.choice(self.template_pairs)
-
-        # Load and resize images
-        virgin_img = self._resize_template(
-            Image.open(os.path.join(self.template_dir, virgin_template)).convert("RGBA")
-        )
-        chad_img = self._resize_template(
-            Image.open(os.path.join(self.template_dir, chad_template)).convert("RGBA")
-        )
-
-        chad_points, virgin_points = self.argument_generator.generate_points(
-            topic, virgin, self.layout_manager.num_points
-        )
+        if seed is None:
+            rng, layout_rng = random, None
+        else:
+            # The seed also fixes the template pair, so it needs no key slot
+            cache_key = (topic, virgin_side, seed)
+            with self._meme_cache_lock:
+                cached = self._meme_cache.get(cache_key)
+                if cached is not None:
+                    self._meme_cache.move_to_end(cache_key)
+                    return cached.copy()
+            rng, layout_rng = random.Random(seed), np.random.default_rng(seed)
+
+        # Start from a copy of the chosen pair's prebuilt background
+        pair_idx = rng.randrange(len(self._base_canvases))
+        base_canvas, virgin_anchor, chad_anchor = self._base_canvases[pair_idx]
+        canvas = base_canvas.copy()
 
-        draw = ImageDraw.Draw(canvas)
         try:
-            font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24
+            chad_points, virgin_points = self.argument_generator.generate_points(
+                topic, virgin, self.layout_manager.num_points
+            )
+            generated = True
+        except PointGenerationError as e:
+            print(f"{e}, using template points instead")
+            generated = False
+            num_points = self.layout_manager.num_points
+            chad_points = self.argument_generator._generate_themed_points(
+                chad, True, num_points, rng
+            )
+            virgin_points = self.argument_generator._generate_themed_points(
+                virgin, False, num_points, rng
             )
-        except OSError:
-            font = ImageFont.load_default()
-
-        # Position images
-        virgin_x = int(self.canvas_size[0] * 0.35 - virgin_img.width / 2)
-        chad_x = int(self.canvas_size[0] * 0.65 - chad_img.width / 2)
 
-        canvas.paste(virgin_img, (virgin_x, 250), virgin_img)
-        canvas.paste(chad_img, (chad_x, 250), chad_img)
+        font = self._body_font
 
         # Add centered titles
         virgin_title = f"The Virgin {virgin}"
         chad_title = f"The Chad {chad}"
 
-        virgin_bbox = font.getbbox(virgin_title)
-        chad_bbox = font.getbbox(chad_title)
-        virgin_title_width = virgin_bbox[2] - virgin_bbox[0]
-        chad_title_width = chad_bbox[2] - chad_bbox[0]
+        virgin_title_width = _get_text_width(virgin_title, font)
+        chad_title_width = _get_text_width(chad_title, font)
 
-        virgin_title_x = virgin_x + virgin_img.width // 4 - virgin_title_width // 2
-        chad_title_x = chad_x + chad_img.width // 4 - chad_title_width // 2
+        virgin_title_x = virgin_anchor - virgin_title_width // 2
+        chad_title_x = chad_anchor - chad_title_width // 2
 
-        self._add_text_with_outline(
-            draw, virgin_title, (virgin_title_x, 100), font, True
-        )
-        self._add_text_with_outline(draw, chad_title, (chad_title_x, 100), font, True)
+        tiles = [
+            self._render_text_tile(virgin_title, (virgin_title_x, 100), True),
+            self._render_text_tile(chad_title, (chad_title_x, 100), True),
+        ]
 
         # Add points with new positioning
-        virgin_positions = self.layout_manager.get_positions(False)
-        chad_positions = self.layout_manager.get_positions(True)
+        virgin_positions = self.layout_manager.get_positions(False, layout_rng)
+        chad_positions = self.layout_manager.get_positions(True, layout_rng)
+
+        tiles.extend(
+            self._render_text_tile(point, pos)
+            for points, positions in (
+                (virgin_points, virgin_positions),
+                (chad_points, chad_positions),
+            )
+            for point, pos in zip(points, positions)
+        )
 
-        for point, pos in zip(virgin_points, virgin_positions):
-            self._add_text_with_outline(draw, point, pos, font)
+        self._composite_tiles(canvas, tiles)
 
-        for point, pos in zip(chad_points, chad_positions):
-            self._add_text_with_outline(draw, point, pos, font)
+        # Memes on fallback points are not cached so a later call can retry the API
+        if seed is not None and generated:
+            with self._meme_cache_lock:
+                self._meme_cache[cache_key] = canvas
+                if len(self._meme_cache) > MEME_CACHE_SIZE:
+                    self._meme_cache.popitem(last=False)
+            return canvas.copy()
 
         return canvas
 
+    @staticmethod
+    def save(meme: Image.Image, filename: str, compress_level: int = 1) -> None:
+        """Save a meme as JPEG for .jpg/.jpeg filenames and as PNG otherwise
+
+        Args:
+            meme (Image.Image): Meme returned by generate_meme
+            filename (str): Output path
+            compress_level (int): PNG zlib level; the default favours speed
+                            since the mostly flat background compresses well
+        """
+        if filename.lower().endswith((".jpg", ".jpeg")):
+            meme.save(filename, "JPEG", quality=90)
+        else:
+            meme.save(filename, "PNG", compress_level=compress_level, optimize=False)
 
-def _main_io_handling(topic, virgin_side):
-    # You'll need to provide your Anthropic API key
-    api_key = os.environ["ANTHROPIC_API_KEY"]
-    generator = WojakMemeGenerator(api_key=api_key)
 
+def _main_io_handling(generator, topic, virgin_side, output_format="png"):
     # Extract the two sides from the topic
     sides = topic.lower().split(" vs ")
     if len(sides) != 2:
@@ -365,12 +747,12 @@ def _main_io_handling(topic, virgin_side):
     if virgin_side == "right":
         left_side, right_side = right_side, left_side
 
-    output_filename = f"res/{left_side}_vs_{right_side}.png"
+    output_filename = f"res/{left_side}_vs_{right_side}.{output_format}"
 
     # Generate and save the meme
     print(f"\nGenerating meme...")
     meme = generator.generate_meme(topic, virgin_side)
-    meme.save(output_filename)
+    generator.save(meme, output_filename)
     print(f"Meme saved as: {output_filename}")
 
 
@@ -379,6 +761,18 @@ def main():
     print("Enter your comparison in the format 'X vs Y':")
     topic = input("> ").strip()
 
+    # You'll need to provide your Anthropic API key. One generator serves every
+    # meme so templates and fonts are only set up once
+    api_key = os.environ["ANTHROPIC_API_KEY"]
+    # Set CHAD_CACHE_PATH to move the points cache, or to "" to disable it
+    cache_path = os.environ.get("CHAD_CACHE_PATH", CACHE_PATH)
+    generator = WojakMemeGenerator(api_key=api_key, cache_path=cache_path)
+
+    # Set CHAD_OUTPUT_FORMAT=jpg for smaller, faster-to-write files
+    output_format = os.environ.get("CHAD_OUTPUT_FORMAT", "png").lower()
+    if output_format not in ("png", "jpg", "jpeg"):
+        raise ValueError("CHAD_OUTPUT_FORMAT must be png, jpg or jpeg")
+
     # Get side preference
     while True:
         print("\nWhich side should be the 'Virgin'?")
@@ -388,14 +782,22 @@ def main():
         choice = input("Enter 1, 2 or 3: ").strip()
 
         if choice == "1":
-            _main_io_handling(topic, "left")
+            _main_io_handling(generator, topic, "left", output_format)
             break
         elif choice == "2":
-            _main_io_handling(topic, "right")
+            _main_io_handling(generator, topic, "right", output_format)
             break
         elif choice == "3":
-            _main_io_handling(topic, "right")
-            _main_io_handling(topic, "left")
+            # Both memes are independent and mostly waiting on the API
+            with concurrent.futures.ThreadPoolExecutor(2) as executor:
+                list(
+                    executor.map(
+                        lambda side: _main_io_handling(
+                            generator, topic, side, output_format
+                        ),
+                        ["left", "right"],
+                    )
+                )
             break
         else:
             print("Invalid choice. Please enter 1, 2 or 3.")